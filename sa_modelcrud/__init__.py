@@ -4,9 +4,19 @@ __author__ = """Lucas Lucyk"""
 __email__ = "llucyk@gmail.com"
 # __version__ = "0.0.1"
 
-from .crud import CRUDBase
+from .crud import CRUDBase, IdLoader
 from .exceptions import CreateException, NotFoundException
 from .models import ModelBase
+from .session import make_engine, make_sessionmaker, warmup
 
 
-__all__ = ["CRUDBase", "CreateException", "NotFoundException", "ModelBase"]
+__all__ = [
+    "CRUDBase",
+    "IdLoader",
+    "CreateException",
+    "NotFoundException",
+    "ModelBase",
+    "make_engine",
+    "make_sessionmaker",
+    "warmup",
+]
@@ -1,4 +1,5 @@
 from .base import CRUDBase
+from .loader import IdLoader
 
 
-__all__ = ["CRUDBase"]
+__all__ = ["CRUDBase", "IdLoader"]
@@ -1,23 +1,45 @@
+import asyncio
 from abc import ABC, abstractproperty
-from datetime import datetime
+from collections import OrderedDict
+from functools import cached_property
 from typing import (
     Any,
+    AsyncIterator,
+    ClassVar,
     Dict,
+    FrozenSet,
     Generic,
     Iterable,
     List,
     Optional,
+    Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
 )
 from uuid import UUID
 from pydantic import BaseModel
-from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import (
+    Select,
+    bindparam,
+    delete,
+    event,
+    func,
+    insert,
+    inspect,
+    select,
+    update,
+)
+from sqlalchemy.engine import Result, ScalarResult
+from sqlalchemy.exc import CompileError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ONETOMANY, Session
+from sqlalchemy.sql.base import ExecutableOption
 from ..models.base import ModelBase
 from ..exceptions.crud import NotFoundException, CreateException
+from .loader import IdLoader
+from .utils import unique_required
 
 
 ModelType = TypeVar("ModelType", bound=ModelBase)
@@ -25,33 +47,352 @@ CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
+def _dump_chunk(elements: List[BaseModel]) -> List[Dict[str, Any]]:
+    """Dump schemas with python mode to keep native types"""
+
+    return [element.model_dump(mode="python") for element in elements]
+
+
+# session info key of models written in the current transaction
+_WRITTEN_MODELS = "sa_modelcrud_written_models"
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _expire_written(session: Session) -> None:
+    """Bump versions of models written in the ended session transaction
+
+    Args:
+        session (Session): Sync session of the committed or rolled back
+            transaction
+    """
+
+    written = session.info.get(_WRITTEN_MODELS)
+    if not written:
+        return
+
+    versions = CRUDBase._versions
+    for model in written:
+        versions[model] = versions.get(model, 0) + 1
+    written.clear()
+
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC):
+    # loader options applied to every select, e.g. `(selectinload(...),)`
+    default_options: ClassVar[Tuple[ExecutableOption, ...]] = ()
+
+    # max `filter` results cached as ids, 0 disables it. Only suited for
+    # read-only or append-mostly tables written through the CRUD.
+    filter_cache_size: ClassVar[int] = 0
+
+    # unique and indexed column ordering `list_after` pages
+    keyset_column: ClassVar[str] = "id"
+
+    # `bulk_create` batches larger than this are dumped off the event loop
+    dump_chunk_size: ClassVar[int] = 256
+
+    # write counter by model, part of `filter` cache keys
+    _versions: ClassVar[Dict[Type[ModelBase], int]] = {}
+
     @abstractproperty
     def model(self) -> Type[ModelType]:
         ...
 
-    async def get(self, db: AsyncSession, id: UUID) -> Optional[ModelType]:
+    # attributes are computed on first use, so subclasses need no init and
+    # mappers are not configured before related models exist
+
+    @cached_property
+    def _get_stmt(self) -> Select:
+        """Statement reused by every call of `get`"""
+
+        return self._select().where(self.model.id == bindparam("id"))
+
+    @cached_property
+    def _list_stmt(self) -> Select:
+        """Statement reused by every call of `list`"""
+
+        return (
+            self._select()
+            .offset(bindparam("offset"))
+            .limit(bindparam("limit"))
+        )
+
+    @cached_property
+    def _filter_cache(self) -> "OrderedDict[Tuple[Any, ...], List[UUID]]":
+        """`filter` results ids by where clause, least recently used first"""
+
+        return OrderedDict()
+
+    @cached_property
+    def _column_keys(self) -> FrozenSet[str]:
+        """Column attributes accepted by `UPDATE` statements"""
+
+        return frozenset(inspect(self.model).column_attrs.keys())
+
+    @cached_property
+    def _server_attrs(self) -> List[str]:
+        """Attributes generated by the database on insert or update"""
+
+        return [
+            attr.key
+            for attr in inspect(self.model).column_attrs
+            if any(
+                col.server_default is not None
+                or col.server_onupdate is not None
+                for col in attr.columns
+            )
+        ]
+
+    @cached_property
+    def _onupdate_attrs(self) -> List[str]:
+        """Attributes generated by the database on update"""
+
+        def generated(col: Any) -> bool:
+            # python scalars and callables are known before the flush
+            default = col.onupdate
+            return col.server_onupdate is not None or (
+                default is not None
+                and not (default.is_scalar or default.is_callable)
+            )
+
+        return [
+            attr.key
+            for attr in inspect(self.model).column_attrs
+            if any(generated(col) for col in attr.columns)
+        ]
+
+    @cached_property
+    def _unique_default(self) -> bool:
+        """Default loaders join collections, so rows are repeated"""
+
+        return unique_required(self.model, self.default_options)
+
+    def _has_orm_hooks(self, *events: str) -> bool:
+        """Check if the model has validators or listeners for mapper `events`
+
+        Core statements skip attribute instrumentation and mapper events,
+        so models using them have to be written through the ORM.
+
+        Args:
+            *events (str): Mapper event names, e.g. `"before_insert"`
+
+        Returns:
+            bool: True if the ORM unit of work must be used
+        """
+
+        mapper = inspect(self.model)
+        return bool(mapper.validators) or any(
+            getattr(mapper.dispatch, event) for event in events
+        )
+
+    def _has_insert_hooks(self) -> bool:
+        """Check if inserts must build instances through the model
+
+        Returns:
+            bool: True if validators, insert events or a custom constructor
+                are declared
+        """
+
+        manager = inspect(self.model).class_manager
+        return self._has_orm_hooks("before_insert", "after_insert") or (
+            manager.original_init is not self.model.registry.constructor
+        )
+
+    def _has_delete_hooks(self) -> bool:
+        """Check if deletes must go through the ORM unit of work
+
+        The unit of work also cascades deletes, removes association rows
+        of `secondary` tables and nulls children foreign keys without
+        `passive_deletes`.
+
+        Returns:
+            bool: True if relationships have to be handled on delete or
+                delete events are declared
+        """
+
+        mapper = inspect(self.model)
+        return any(
+            rel.cascade.delete
+            or rel.secondary is not None
+            or (rel.direction is ONETOMANY and not rel.passive_deletes)
+            for rel in mapper.relationships
+            if not rel.viewonly
+        ) or any(
+            getattr(mapper.dispatch, event)
+            for event in ("before_delete", "after_delete")
+        )
+
+    def _select(self, options: Sequence[ExecutableOption] = ()) -> Select:
+        """Create a model select with default and given loader options
+
+        Args:
+            options (Sequence[ExecutableOption], optional): Loader options.
+                Defaults to ().
+
+        Returns:
+            Select: Select statement of model
+        """
+
+        stmt = select(self.model)
+        if self.default_options or options:
+            stmt = stmt.options(*self.default_options, *options)
+
+        return stmt
+
+    def _unique(self, options: Sequence[ExecutableOption] = ()) -> bool:
+        """Check if results must be uniqued for the given loader options
+
+        Args:
+            options (Sequence[ExecutableOption], optional): Loader options.
+                Defaults to ().
+
+        Returns:
+            bool: True if `unique()` must be applied to the results
+        """
+
+        return self._unique_default or (
+            bool(options) and unique_required(self.model, options)
+        )
+
+    def _scalars(
+        self, result: Result, options: Sequence[ExecutableOption] = ()
+    ) -> ScalarResult:
+        """Get model scalars of a result, uniqued only when loaders need it
+
+        Args:
+            result (Result): Executed select result
+            options (Sequence[ExecutableOption], optional): Loader options
+                of the select. Defaults to ().
+
+        Returns:
+            ScalarResult: Model instances result
+        """
+
+        scalars = result.scalars()
+        if self._unique(options):
+            scalars = scalars.unique()
+
+        return scalars
+
+    def _invalidate(
+        self, db: AsyncSession, cache: Optional[Dict[Any, Any]]
+    ) -> None:
+        """Drop cached results of model from a per-request cache
+
+        Also bumps the model version, expiring cached `filter` results,
+        and again once the transaction of `db` ends, so results cached by
+        other sessions before the commit are expired too.
+
+        Args:
+            db (AsyncSession): Async db session of the write
+            cache (Optional[Dict[Any, Any]]): Per-request results cache
+        """
+
+        versions = CRUDBase._versions
+        versions[self.model] = versions.get(self.model, 0) + 1
+
+        # bumped again by `_expire_written` when the transaction ends
+        db.info.setdefault(_WRITTEN_MODELS, set()).add(self.model)
+
+        if cache:
+            # cache may be shared with values not from CRUDs
+            keys = [
+                k
+                for k in cache
+                if isinstance(k, tuple) and k and k[0] is self.model
+            ]
+            for key in keys:
+                del cache[key]
+
+    def loader(
+        self, db: AsyncSession, *, options: Sequence[ExecutableOption] = ()
+    ) -> IdLoader[ModelType]:
+        """Create a loader batching concurrent `get` calls into one query
+
+        Args:
+            db (AsyncSession): Async db session
+            options (Sequence[ExecutableOption], optional): Loader options,
+                e.g. `[selectinload(Model.items)]`. Defaults to ().
+
+        Returns:
+            IdLoader[ModelType]: Loader bound to `db` and the CRUD model
+        """
+
+        return IdLoader(
+            db=db,
+            model=self.model,
+            options=(*self.default_options, *options),
+        )
+
+    async def get(
+        self,
+        db: AsyncSession,
+        id: UUID,
+        *,
+        cache: Optional[Dict[Any, Any]] = None,
+        loader: Optional[IdLoader[ModelType]] = None,
+        options: Sequence[ExecutableOption] = (),
+    ) -> Optional[ModelType]:
         """Get row from model by uid
 
         Args:
             db (AsyncSession): Async db session
             id (UUID): UUID to filter
+            cache (Optional[Dict[Any, Any]], optional): Per-request results
+                cache, e.g. a new dict from a request dependency. Defaults
+                to None.
+            loader (Optional[IdLoader[ModelType]], optional): Loader from
+                `CRUDBase.loader` to batch concurrent calls. Defaults to None.
+            options (Sequence[ExecutableOption], optional): Loader options,
+                e.g. `[selectinload(Model.items)]`. Must be given to
+                `CRUDBase.loader` instead when using a loader. Defaults to ().
+
+        Raises:
+            ValueError: If both `loader` and `options` are given
 
         Returns:
             Optional[ModelType]: ModelType instance or None if id not exists
         """
 
-        res = await db.execute(select(self.model).where(self.model.id == id))
-        return res.scalar()
+        if loader is not None and options:
+            raise ValueError("options must be given to loader() instead")
+
+        # lookups with options bypass the cache to honor their loaders
+        key = (self.model, id)
+        if cache is not None and not options and key in cache:
+            return cache[key]
+
+        if loader is not None:
+            obj = await loader.load(id)
+        else:
+            stmt = self._get_stmt
+            if options:
+                stmt = stmt.options(*options)
+            res = await db.execute(stmt, {"id": id})
+            obj = self._scalars(res, options).first()
+
+        if cache is not None and obj is not None:
+            cache[key] = obj
+
+        return obj
 
     async def get_or_raise(
-        self, db: AsyncSession, id: UUID
+        self,
+        db: AsyncSession,
+        id: UUID,
+        *,
+        cache: Optional[Dict[Any, Any]] = None,
+        options: Sequence[ExecutableOption] = (),
     ) -> Optional[ModelType]:
         """Try to get row from model by uid
 
         Args:
             db (AsyncSession): Async db session
             id (UUID): UUID to filter
+            cache (Optional[Dict[Any, Any]], optional): Per-request results
+                cache. Defaults to None.
+            options (Sequence[ExecutableOption], optional): Loader options,
+                e.g. `[selectinload(Model.items)]`. Defaults to ().
 
         Raises:
             NotFoundException: If item does not exist
@@ -61,7 +402,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC):
         """
 
         # try get item
-        obj = await self.get(db=db, id=id)
+        obj = await self.get(db=db, id=id, cache=cache, options=options)
 
         if not obj:
             raise NotFoundException(f"{self.model.__name__} not found")
@@ -69,7 +410,12 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC):
         return obj
 
     async def list(
-        self, db: AsyncSession, *, offset: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        options: Sequence[ExecutableOption] = (),
     ) -> List[ModelType]:
         """Get multi items from database without filter criteria
 
@@ -77,15 +423,53 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC):
             db (AsyncSession): Async db session
             offset (int, optional): Optional Offset. Defaults to 0.
             limit (int, optional): Optional limit. Defaults to 100.
+            options (Sequence[ExecutableOption], optional): Loader options,
+                e.g. `[selectinload(Model.items)]`. Defaults to ().
 
         Returns:
             List[ModelType]: Matching results list
         """
 
-        results = await db.execute(
-            select(self.model).offset(offset).limit(limit)
-        )
-        return results.scalars().all()
+        stmt = self._list_stmt
+        if options:
+            stmt = stmt.options(*options)
+        results = await db.execute(stmt, {"offset": offset, "limit": limit})
+        return self._scalars(results, options).all()
+
+    async def list_after(
+        self,
+        db: AsyncSession,
+        *,
+        after: Any = None,
+        limit: int = 100,
+        options: Sequence[ExecutableOption] = (),
+    ) -> List[ModelType]:
+        """Get the page of items following `after` in `keyset_column` order
+
+        Unlike `offset` on `list`, the database seeks straight to the page
+        instead of reading and discarding previous rows, but pages can only
+        be walked sequentially.
+
+        Args:
+            db (AsyncSession): Async db session
+            after (Any, optional): `keyset_column` value of the last item of
+                the previous page, None for the first page. Defaults to None.
+            limit (int, optional): Optional limit. Defaults to 100.
+            options (Sequence[ExecutableOption], optional): Loader options,
+                e.g. `[selectinload(Model.items)]`. Defaults to ().
+
+        Returns:
+            List[ModelType]: Matching results list
+        """
+
+        column = getattr(self.model, self.keyset_column)
+
+        stmt = self._select(options)
+        if after is not None:
+            stmt = stmt.where(column > after)
+
+        results = await db.execute(stmt.order_by(column).limit(limit))
+        return self._scalars(results, options).all()
 
     async def filter(
         self,
@@ -94,29 +478,118 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC):
         *,
         offset: int = 0,
         limit: int = 100,
+        options: Sequence[ExecutableOption] = (),
     ) -> List[ModelType]:
         """Get items from database using `whereclause` to filter
 
+        When `filter_cache_size` is set, matching ids are cached by where
+        clause and fetched by primary key until the model is written.
+
         Args:
             db (AsyncSession): Async db session
             whereclause (Any): Whereclause to filter.
             offset (int, optional): Optional Offset. Defaults to 0.
             limit (int, optional): Optional limit. Defaults to 100.
+            options (Sequence[ExecutableOption], optional): Loader options,
+                e.g. `[selectinload(Model.items)]`. Defaults to ().
 
         Returns:
             List[ModelType]:
                 Instance or list of intance of matching items.
         """
 
+        # recurring predicates are resolved by primary key
+        key = self._filter_key(db, whereclause, offset, limit)
+        if key is not None and key in self._filter_cache:
+            self._filter_cache.move_to_end(key)
+            return await self._get_many(db, self._filter_cache[key], options)
+
         # try to get
         result = await db.execute(
-            select(self.model).where(whereclause).offset(offset).limit(limit)
+            self._select(options)
+            .where(whereclause)
+            .offset(offset)
+            .limit(limit)
         )
+        objs = self._scalars(result, options).all()
 
-        return result.scalars().all()
+        if key is not None:
+            self._filter_cache[key] = [obj.id for obj in objs]
+            if len(self._filter_cache) > self.filter_cache_size:
+                self._filter_cache.popitem(last=False)
+
+        return objs
+
+    def _filter_key(
+        self, db: AsyncSession, whereclause: Any, offset: int, limit: int
+    ) -> Optional[Tuple[Any, ...]]:
+        """Build the `filter` cache key of a where clause
+
+        Args:
+            db (AsyncSession): Async db session
+            whereclause (Any): Whereclause to filter.
+            offset (int): Offset.
+            limit (int): Limit.
+
+        Returns:
+            Optional[Tuple[Any, ...]]: Cache key or None if cache is disabled
+                or the clause can not be rendered with literal values
+        """
+
+        if not self.filter_cache_size:
+            return None
+
+        bind = db.get_bind()
+        try:
+            sql = str(
+                whereclause.compile(
+                    dialect=bind.dialect,
+                    compile_kwargs={"literal_binds": True},
+                )
+            )
+        except (CompileError, NotImplementedError):
+            return None
+
+        # ids are only valid for the database they were read from
+        version = CRUDBase._versions.get(self.model, 0)
+        return (version, bind.url, sql, offset, limit)
+
+    async def _get_many(
+        self,
+        db: AsyncSession,
+        ids: List[UUID],
+        options: Sequence[ExecutableOption] = (),
+    ) -> List[ModelType]:
+        """Get rows from model by ids keeping the ids order
+
+        Args:
+            db (AsyncSession): Async db session
+            ids (List[UUID]): UUIDs to filter
+            options (Sequence[ExecutableOption], optional): Loader options.
+                Defaults to ().
+
+        Returns:
+            List[ModelType]: Found items
+        """
+
+        if not ids:
+            return []
+
+        result = await db.execute(
+            self._select(options).where(self.model.id.in_(ids))
+        )
+        found = {obj.id: obj for obj in self._scalars(result, options)}
+
+        return [found[id] for id in ids if id in found]
 
     async def find(
-        self, db: AsyncSession, *, offset: int = 0, limit: int = 100, **kwargs
+        self,
+        db: AsyncSession,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        options: Sequence[ExecutableOption] = (),
+        **kwargs,
     ) -> List[ModelType]:
         """Find elements with kwargs
 
@@ -124,99 +597,299 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC):
             db (AsyncSession): Async db session
             offset (int, optional): Optional Offset. Defaults to 0.
             limit (int, optional): Optional limit. Defaults to 100.
+            options (Sequence[ExecutableOption], optional): Loader options,
+                e.g. `[selectinload(Model.items)]`. Defaults to ().
 
         Returns:
             List[ModelType]: list of results
         """
 
         result = await db.execute(
-            select(self.model).filter_by(**kwargs).offset(offset).limit(limit)
+            self._select(options)
+            .filter_by(**kwargs)
+            .offset(offset)
+            .limit(limit)
         )
 
-        return result.scalars().all()
+        return self._scalars(result, options).all()
+
+    async def iter(
+        self,
+        db: AsyncSession,
+        whereclause: Any = None,
+        *,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        options: Sequence[ExecutableOption] = (),
+        **kwargs,
+    ) -> AsyncIterator[ModelType]:
+        """Iterate items from database streaming the results
+
+        Unlike `list`, `filter` and `find`, results are not buffered into a
+        list and are not limited by default, so prefer it when all matching
+        items only need a single pass.
 
-    async def find_one(self, db: AsyncSession, **kwargs) -> ModelType:
+        Args:
+            db (AsyncSession): Async db session
+            whereclause (Any, optional): Whereclause to filter.
+                Defaults to None.
+            offset (Optional[int], optional): Optional Offset.
+                Defaults to None.
+            limit (Optional[int], optional): Optional limit. Defaults to None.
+            options (Sequence[ExecutableOption], optional): Loader options,
+                e.g. `[selectinload(Model.items)]`. Defaults to ().
+
+        Yields:
+            ModelType: Matching items
+        """
+
+        stmt = self._select(options)
+        if whereclause is not None:
+            stmt = stmt.where(whereclause)
+        if kwargs:
+            stmt = stmt.filter_by(**kwargs)
+        if offset is not None:
+            stmt = stmt.offset(offset)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        result = await db.stream_scalars(stmt)
+        if self._unique(options):
+            result = result.unique()
+
+        try:
+            async for element in result:
+                yield element
+        finally:
+            # release the cursor if caller stops early
+            await result.close()
+
+    async def find_one(
+        self,
+        db: AsyncSession,
+        *,
+        cache: Optional[Dict[Any, Any]] = None,
+        options: Sequence[ExecutableOption] = (),
+        **kwargs,
+    ) -> ModelType:
         """Find an element with kwargs
 
         Args:
             db (AsyncSession): Async db session
+            cache (Optional[Dict[Any, Any]], optional): Per-request results
+                cache. Kwargs values must be hashable. Defaults to None.
+            options (Sequence[ExecutableOption], optional): Loader options,
+                e.g. `[selectinload(Model.items)]`. Defaults to ().
 
         Returns:
             ModelType: First result object
         """
 
+        # lookups with options bypass the cache to honor their loaders
+        key = (self.model, tuple(sorted(kwargs.items())))
+        if cache is not None and not options and key in cache:
+            return cache[key]
+
+        result = await db.execute(
+            self._select(options).filter_by(**kwargs).limit(1)
+        )
+        obj = self._scalars(result, options).first()
+
+        if cache is not None and obj is not None:
+            cache[key] = obj
+
+        return obj
+
+    async def count(self, db: AsyncSession, whereclause: Any = None) -> int:
+        """Count items in database, optionally matching `whereclause`
+
+        Args:
+            db (AsyncSession): Async db session
+            whereclause (Any, optional): Whereclause to filter.
+                Defaults to None.
+
+        Returns:
+            int: Number of matching items
+        """
+
+        stmt = select(func.count()).select_from(self.model)
+        if whereclause is not None:
+            stmt = stmt.where(whereclause)
+
+        result = await db.execute(stmt)
+        return result.scalar_one()
+
+    async def exists(self, db: AsyncSession, whereclause: Any = None) -> bool:
+        """Check if any item exists, optionally matching `whereclause`
+
+        Args:
+            db (AsyncSession): Async db session
+            whereclause (Any, optional): Whereclause to filter.
+                Defaults to None.
+
+        Returns:
+            bool: True if at least one item matches
+        """
+
+        subquery = select(self.model.id)
+        if whereclause is not None:
+            subquery = subquery.where(whereclause)
+
+        result = await db.execute(select(subquery.exists()))
+        return bool(result.scalar())
+
+    async def find_exactly_one(
+        self,
+        db: AsyncSession,
+        *,
+        options: Sequence[ExecutableOption] = (),
+        **kwargs,
+    ) -> ModelType:
+        """Find the single element matching kwargs
+
+        Args:
+            db (AsyncSession): Async db session
+            options (Sequence[ExecutableOption], optional): Loader options,
+                e.g. `[selectinload(Model.items)]`. Defaults to ().
+
+        Raises:
+            NotFoundException: If no item matches
+            MultipleResultsFound: If more than one item matches
+
+        Returns:
+            ModelType: Matching result object
+        """
+
+        # two rows are enough to detect duplicates
         result = await db.execute(
-            select(self.model).filter_by(**kwargs).limit(1)
+            self._select(options).filter_by(**kwargs).limit(2)
         )
+        obj = self._scalars(result, options).one_or_none()
 
-        return result.scalar()
+        if obj is None:
+            raise NotFoundException(f"{self.model.__name__} not found")
 
-    @staticmethod
-    def _set_updated_at(element: ModelType) -> None:
-        """Set `updated_at` property to current time if property exists
+        return obj
+
+    async def _finish(
+        self,
+        db: AsyncSession,
+        elements: Iterable[ModelType],
+        *,
+        commit: bool = True,
+        refresh: Union[bool, Sequence[str]] = True,
+    ) -> None:
+        """Flush pending changes, then refresh and commit as requested
 
         Args:
-            obj (ModelType): Object instance
+            db (AsyncSession): Async db session
+            elements (Iterable[ModelType]): Flushed ModelType instances
+            commit (bool, optional): Commit the transaction. Defaults to True.
+            refresh (Union[bool, Sequence[str]], optional): Reload database
+                generated attributes, or only the given attribute names.
+                Defaults to True.
         """
 
-        if hasattr(element, "updated_at"):
-            setattr(element, "updated_at", datetime.utcnow())
+        await db.flush()
+
+        # only server generated values are unknown after flush
+        attrs = self._server_attrs if refresh is True else list(refresh or ())
+        if attrs:
+            for element in elements:
+                await db.refresh(element, attribute_names=attrs)
+
+        if not commit:
+            return
+
+        await db.commit()
+
+        # committed instances are expired unless session disables it
+        if db.sync_session.expire_on_commit:
+            for element in elements:
+                await db.refresh(element)
 
-    async def _save(self, db: AsyncSession, element: ModelType) -> ModelType:
+    async def _save(
+        self,
+        db: AsyncSession,
+        element: ModelType,
+        *,
+        commit: bool = True,
+        refresh: Union[bool, Sequence[str]] = True,
+        cache: Optional[Dict[Any, Any]] = None,
+    ) -> ModelType:
         """_save an object into database
 
+        Use `commit=False` to only flush the changes when the caller manages
+        the outer transaction, e.g. with `async with db.begin():`.
+
         Args:
             db (AsyncSession): Async db session
             element (ModelType): ModelType instance to _save
+            commit (bool, optional): Commit the transaction. Defaults to True.
+            refresh (Union[bool, Sequence[str]], optional): Reload database
+                generated attributes, or only the given attribute names.
+                Defaults to True.
+            cache (Optional[Dict[Any, Any]], optional): Per-request results
+                cache to invalidate. Defaults to None.
 
         Returns:
             ModelType: _saved object instance
         """
 
-        # set updated_at
-        self._set_updated_at(element)
-
-        # add, commit and refresh
+        # add, flush and optionally refresh and commit
+        self._invalidate(db, cache)
         db.add(element)
-        await db.commit()
-        await db.refresh(element)
+        await self._finish(db, (element,), commit=commit, refresh=refresh)
 
         # return instance
         return element
 
     async def _save_all(
-        self, db: AsyncSession, elements: Iterable[ModelType]
+        self,
+        db: AsyncSession,
+        elements: Iterable[ModelType],
+        *,
+        commit: bool = True,
+        refresh: bool = True,
+        cache: Optional[Dict[Any, Any]] = None,
     ) -> Iterable[ModelType]:
         """_save an iterable of elements into database
 
         Args:
             db (AsyncSession): Async db session
             elements (Iterable[ModelType]): Iterable of ModelType instance to _save
+            commit (bool, optional): Commit the transaction. Defaults to True.
+            refresh (bool, optional): Reload database generated attributes.
+                Defaults to True.
+            cache (Optional[Dict[Any, Any]], optional): Per-request results
+                cache to invalidate. Defaults to None.
 
         Returns:
             Iterable[ModelType]: Iterable of ModelType instance
         """
 
-        # set updated_at
-        _ = list(map(self._set_updated_at, elements))
-
-        # add, commit and refresh
+        # add, flush and optionally refresh and commit
+        self._invalidate(db, cache)
         db.add_all(elements)
-        await db.commit()
-        for element in elements:
-            await db.refresh(element)
+        await self._finish(db, elements, commit=commit, refresh=refresh)
 
         # return instances
         return elements
 
     async def create(
-        self, db: AsyncSession, element: CreateSchemaType
+        self,
+        db: AsyncSession,
+        element: CreateSchemaType,
+        *,
+        commit: bool = True,
     ) -> ModelType:
         """Create an item into database
 
         Args:
             db (AsyncSession): Async db session
             element (CreateSchemaType): Schema to create
+            commit (bool, optional): Commit the transaction, use False to only
+                flush when the caller manages it. Defaults to True.
 
         Raises:
             CreateException: if item already exists or unexpected error
@@ -226,21 +899,27 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC):
         """
 
         try:
-            # try json encode
+            # python mode keeps native types such as UUID and datetime
             db_obj = self.model(**element.model_dump(mode="python"))
-            return await self._save(db=db, element=db_obj)
+            return await self._save(db=db, element=db_obj, commit=commit)
 
         except IntegrityError:
             raise CreateException(f"{self.model.__name__} already exists.")
 
     async def bulk_create(
-        self, db: AsyncSession, elements: Iterable[CreateSchemaType]
+        self,
+        db: AsyncSession,
+        elements: Iterable[CreateSchemaType],
+        *,
+        commit: bool = True,
     ) -> Iterable[ModelType]:
         """Create items into database
 
         Args:
             db (AsyncSession): Async db session
-            data (Iterable[CreateSchemaType]): Iterable of Schema to create
+            elements (Iterable[CreateSchemaType]): Iterable of Schema to create
+            commit (bool, optional): Commit the transaction, use False to only
+                flush when the caller manages it. Defaults to True.
 
         Raises:
             CreateException: if an item already exists or unexpected error
@@ -250,60 +929,260 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC):
         """
 
         try:
-            # try json encode
-            db_objs = [
-                self.model(**d.model_dump(mode="python")) for d in elements
-            ]
-            return await self._save_all(db=db, elements=db_objs)
+            payload = await self._dump_all(elements)
+
+            # dialects without executemany RETURNING and models with
+            # validators, insert events or constructor use the ORM flow
+            dialect = db.get_bind().dialect
+            if (
+                not dialect.insert_executemany_returning
+                or self._has_insert_hooks()
+            ):
+                db_objs = [self.model(**d) for d in payload]
+                return await self._save_all(
+                    db=db, elements=db_objs, commit=commit
+                )
+
+            # single INSERT .. RETURNING for the whole batch
+            if not payload:
+                return []
+
+            self._invalidate(db, None)
+            stmt = insert(self.model).returning(
+                self.model, sort_by_parameter_order=True
+            )
+            result = await db.execute(stmt, payload)
+            db_objs = result.scalars().all()
+
+            # returned values are already loaded, no refresh needed
+            await self._finish(db, db_objs, commit=commit, refresh=False)
+
+            return db_objs
 
         except IntegrityError:
             raise CreateException(f"{self.model.__name__} already exists.")
 
+    async def _dump_all(
+        self, elements: Iterable[CreateSchemaType]
+    ) -> List[Dict[str, Any]]:
+        """Dump schemas to dicts, in executor threads for large batches
+
+        Dumping is CPU bound, chunks run off the event loop so other tasks
+        keep being served while a large batch is encoded.
+
+        Args:
+            elements (Iterable[CreateSchemaType]): Iterable of Schema to dump
+
+        Returns:
+            List[Dict[str, Any]]: Dumped schemas in the same order
+        """
+
+        elements = list(elements)
+        size = self.dump_chunk_size
+        if len(elements) <= size:
+            return _dump_chunk(elements)
+
+        loop = asyncio.get_running_loop()
+        chunks = await asyncio.gather(
+            *(
+                loop.run_in_executor(None, _dump_chunk, elements[i : i + size])
+                for i in range(0, len(elements), size)
+            )
+        )
+
+        return [d for chunk in chunks for d in chunk]
+
     async def update(
         self,
         db: AsyncSession,
         *,
         obj: ModelType,
         data: Union[UpdateSchemaType, Dict[str, Any]],
+        cache: Optional[Dict[Any, Any]] = None,
+        commit: bool = True,
     ) -> ModelType:
         """Update a database item with an update schema
 
+        Dict data for an instance of `db` without other pending changes is
+        written with a single `UPDATE .. RETURNING` statement, unless the
+        model has validators, update events or a version counter.
+
         Args:
             db (AsyncSession): Async db session
             obj (ModelType): Item to update
             data (Union[UpdateSchemaType, Dict[str, Any]]):
                 New partial or full data for database item
+            cache (Optional[Dict[Any, Any]], optional): Per-request results
+                cache to invalidate. Defaults to None.
+            commit (bool, optional): Commit the transaction, use False to only
+                flush when the caller manages it. Defaults to True.
 
         Returns:
             ModelType: Instance of updated object
         """
 
-        # obj to dict
+        # obj to dict, `updated_at` is set by the model on update
         if isinstance(data, dict):
-            update_data = data
+            update_data = {k: v for k, v in data.items() if k != "updated_at"}
         else:
-            update_data = data.model_dump(exclude_unset=True)
+            update_data = data.model_dump(
+                exclude_unset=True, exclude={"updated_at"}
+            )
+
+        if isinstance(data, dict) and self._can_update_returning(
+            db, obj, update_data
+        ):
+            return await self._update_returning(
+                db,
+                obj=obj,
+                update_data=update_data,
+                cache=cache,
+                commit=commit,
+            )
 
         # update obj with each field of obj
         for field, value in update_data.items():
             setattr(obj, field, value)
 
-        return await self._save(db=db, element=obj)
+        # attributes are already set on the session-bound instance, only
+        # values of SQL expressions run on update are unknown
+        return await self._save(
+            db=db,
+            element=obj,
+            commit=commit,
+            refresh=self._onupdate_attrs,
+            cache=cache,
+        )
+
+    def _can_update_returning(
+        self, db: AsyncSession, obj: ModelType, update_data: Dict[str, Any]
+    ) -> bool:
+        """Check if `update_data` can skip the ORM unit of work
+
+        The instance must belong to `db` to be the one returned by the
+        statement, which also does not handle version counters.
+
+        Args:
+            db (AsyncSession): Async db session
+            obj (ModelType): Item to update
+            update_data (Dict[str, Any]): Column values to set
+
+        Returns:
+            bool: True if a single `UPDATE .. RETURNING` is enough
+        """
+
+        state = inspect(obj)
+        return (
+            bool(update_data)
+            and update_data.keys() <= self._column_keys
+            and state.has_identity
+            and state.session_id == db.sync_session.hash_key
+            and not state.modified
+            and db.get_bind().dialect.update_returning
+            and inspect(self.model).version_id_col is None
+            and not self._has_orm_hooks("before_update", "after_update")
+        )
+
+    async def _update_returning(
+        self,
+        db: AsyncSession,
+        *,
+        obj: ModelType,
+        update_data: Dict[str, Any],
+        cache: Optional[Dict[Any, Any]] = None,
+        commit: bool = True,
+    ) -> ModelType:
+        """Update a database item with a single `UPDATE .. RETURNING`
 
-    async def delete(self, db: AsyncSession, id: UUID) -> ModelType:
+        Args:
+            db (AsyncSession): Async db session
+            obj (ModelType): Item to update
+            update_data (Dict[str, Any]): Column values to set
+            cache (Optional[Dict[Any, Any]], optional): Per-request results
+                cache to invalidate. Defaults to None.
+            commit (bool, optional): Commit the transaction, use False to only
+                flush when the caller manages it. Defaults to True.
+
+        Raises:
+            NotFoundException: If item does not exist
+
+        Returns:
+            ModelType: Instance of updated object
+        """
+
+        self._invalidate(db, cache)
+
+        stmt = (
+            update(self.model)
+            .where(self.model.id == obj.id)
+            .values(**update_data)
+            .returning(self.model)
+        )
+        result = await db.execute(stmt)
+        updated = result.scalar_one_or_none()
+
+        if updated is None:
+            raise NotFoundException(f"{self.model.__name__} not found")
+
+        # returned values are already loaded, no refresh needed
+        await self._finish(db, (updated,), commit=commit, refresh=False)
+
+        return updated
+
+    async def delete(
+        self,
+        db: AsyncSession,
+        id: UUID,
+        *,
+        cache: Optional[Dict[Any, Any]] = None,
+        commit: bool = True,
+    ) -> ModelType:
         """Delete an item from database
 
         Args:
             db (AsyncSession): Async db session
             id (UUID): Id of model to delete
+            cache (Optional[Dict[Any, Any]], optional): Per-request results
+                cache to invalidate. Defaults to None.
+            commit (bool, optional): Commit the transaction, use False to only
+                flush when the caller manages it. Defaults to True.
+
+        Raises:
+            NotFoundException: If item does not exist
 
         Returns:
             ModelType: Deleted object instance
         """
 
-        obj = await self.get_or_raise(db=db, id=id)
+        self._invalidate(db, cache)
+
+        # dialects without DELETE RETURNING and models with cascades or
+        # delete events need to fetch the item first
+        if (
+            not db.get_bind().dialect.delete_returning
+            or self._has_delete_hooks()
+        ):
+            obj = await self.get_or_raise(db=db, id=id)
+            await db.delete(obj)
+            await (db.commit() if commit else db.flush())
+            return obj
+
+        # delete and fetch deleted item in a single statement
+        stmt = (
+            delete(self.model)
+            .where(self.model.id == id)
+            .returning(self.model)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        obj = result.scalar_one_or_none()
 
-        await db.delete(obj)
-        await db.commit()
+        if obj is None:
+            raise NotFoundException(f"{self.model.__name__} not found")
+
+        # returned row is the session instance, detach it as deleted
+        db.expunge(obj)
+        if commit:
+            await db.commit()
 
         return obj
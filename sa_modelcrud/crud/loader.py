@@ -0,0 +1,98 @@
+import asyncio
+from typing import (
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Type,
+    TypeVar,
+)
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.base import ExecutableOption
+from ..models.base import ModelBase
+from .utils import unique_required
+
+
+ModelType = TypeVar("ModelType", bound=ModelBase)
+
+
+class IdLoader(Generic[ModelType]):
+    """Coalesce concurrent loads by id into a single `WHERE id IN (...)` query
+
+    Ids requested during the same event loop iteration (e.g. from tasks
+    of an `asyncio.gather`) are fetched together with one round trip.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        model: Type[ModelType],
+        options: Sequence[ExecutableOption] = (),
+    ) -> None:
+        self.db = db
+        self.model = model
+        self.options = tuple(options)
+        self._unique = unique_required(model, self.options)
+        self._pending: Dict[UUID, List[asyncio.Future]] = {}
+        self._scheduled = False
+        # strong references to running dispatches
+        self._tasks: Set[asyncio.Task] = set()
+        # session does not support concurrent queries
+        self._lock = asyncio.Lock()
+
+    async def load(self, id: UUID) -> Optional[ModelType]:
+        """Get row from model by id, batched with other pending loads
+
+        Args:
+            id (UUID): UUID to filter
+
+        Returns:
+            Optional[ModelType]: ModelType instance or None if id not exists
+        """
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(id, []).append(future)
+
+        # dispatch once the current loop iteration collected all ids
+        if not self._scheduled:
+            self._scheduled = True
+            task = loop.create_task(self._dispatch())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        return await future
+
+    async def _dispatch(self) -> None:
+        """Fetch all pending ids and resolve their futures"""
+
+        pending, self._pending = self._pending, {}
+        self._scheduled = False
+
+        try:
+            async with self._lock:
+                result = await self.db.execute(
+                    select(self.model)
+                    .options(*self.options)
+                    .where(self.model.id.in_(list(pending)))
+                )
+            scalars = result.scalars()
+            if self._unique:
+                scalars = scalars.unique()
+            found = {obj.id: obj for obj in scalars}
+
+        except Exception as exc:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+
+        for id, futures in pending.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(found.get(id))
@@ -0,0 +1,66 @@
+from typing import Any, Sequence, Type
+from sqlalchemy import inspect
+from sqlalchemy.orm import RelationshipProperty
+from sqlalchemy.sql.base import ExecutableOption
+
+
+def unique_required(
+    model: Type[Any], options: Sequence[ExecutableOption] = ()
+) -> bool:
+    """Check if model rows must be uniqued because of joined collections
+
+    Joined eager loading of a collection repeats the parent row for each
+    child, so results have to be uniqued. Other loaders don't need it and
+    skip hashing every row.
+
+    Args:
+        model (Type[Any]): Mapped model selected
+        options (Sequence[ExecutableOption], optional): Loader options.
+            Defaults to ().
+
+    Returns:
+        bool: True if `unique()` must be applied to the results
+    """
+
+    # collections joined by default on the mapper
+    mapper = inspect(model)
+    for rel in mapper.relationships:
+        if rel.uselist and rel.lazy == "joined":
+            return True
+
+    for option in options:
+        loads = getattr(option, "context", None)
+
+        # wildcards like `joinedload("*")` apply to the model relationships
+        if loads is None:
+            if _joined(option) and _has_collections(mapper):
+                return True
+            continue
+
+        for load in loads:
+            if not _joined(load):
+                continue
+
+            # chained wildcards apply to the entity preceding the token
+            if getattr(load.path, "is_token", False):
+                if _has_collections(load.path[-2].mapper):
+                    return True
+            elif any(
+                isinstance(prop, RelationshipProperty) and prop.uselist
+                for prop in load.path
+            ):
+                return True
+
+    return False
+
+
+def _joined(load: Any) -> bool:
+    """Check if a loader applies the joined eager strategy"""
+
+    return ("lazy", "joined") in (getattr(load, "strategy", None) or ())
+
+
+def _has_collections(mapper: Any) -> bool:
+    """Check if a mapper has any relationship loading a collection"""
+
+    return any(rel.uselist for rel in mapper.relationships)
@@ -1,9 +1,20 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from sqlalchemy import Column, DateTime
 from sqlalchemy.orm import declarative_mixin
 
 
+def utcnow() -> datetime:
+    """Current UTC time as naive datetime, replaces deprecated `utcnow`"""
+
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 @declarative_mixin
 class Timestamp:
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
\ No newline at end of file
+    created_at = Column(DateTime, default=utcnow, nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=utcnow,
+        onupdate=utcnow,
+        nullable=False,
+    )
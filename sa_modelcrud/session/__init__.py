@@ -0,0 +1,4 @@
+from .base import make_engine, make_sessionmaker, warmup
+
+
+__all__ = ["make_engine", "make_sessionmaker", "warmup"]
@@ -1,11 +1,55 @@
 from ..crud import CRUDBase
-from .models import Sample as SampleModel
-from .schemas import SampleCreate, SampleUpdate
-
+from .models import (
+    Author as AuthorModel,
+    Contact as ContactModel,
+    Document as DocumentModel,
+    Invoice as InvoiceModel,
+    Sample as SampleModel,
+)
+from .schemas import (
+    AuthorCreate,
+    AuthorUpdate,
+    ContactCreate,
+    ContactUpdate,
+    DocumentCreate,
+    DocumentUpdate,
+    InvoiceCreate,
+    InvoiceUpdate,
+    SampleCreate,
+    SampleUpdate,
+)
 
 
 class CRUDSample(CRUDBase[SampleModel, SampleCreate, SampleUpdate]):
     model = SampleModel
 
 
-samples = CRUDSample()
\ No newline at end of file
+samples = CRUDSample()
+
+
+class CRUDContact(CRUDBase[ContactModel, ContactCreate, ContactUpdate]):
+    model = ContactModel
+
+
+contacts = CRUDContact()
+
+
+class CRUDInvoice(CRUDBase[InvoiceModel, InvoiceCreate, InvoiceUpdate]):
+    model = InvoiceModel
+
+
+invoices = CRUDInvoice()
+
+
+class CRUDAuthor(CRUDBase[AuthorModel, AuthorCreate, AuthorUpdate]):
+    model = AuthorModel
+
+
+authors = CRUDAuthor()
+
+
+class CRUDDocument(CRUDBase[DocumentModel, DocumentCreate, DocumentUpdate]):
+    model = DocumentModel
+
+
+documents = CRUDDocument()
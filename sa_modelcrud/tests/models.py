@@ -1,4 +1,8 @@
-from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime
+from typing import List
+from uuid import UUID
+from sqlalchemy import Column, ForeignKey, Table, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 from secrets import token_urlsafe
 from ..models import ModelBase, Timestamp
 
@@ -6,4 +10,61 @@ from ..models import ModelBase, Timestamp
 class Sample(Timestamp, ModelBase):
     token: Mapped[str] = mapped_column(default=token_urlsafe)
     describe: Mapped[str] = mapped_column(nullable=True)
-    email: Mapped[str] = mapped_column(nullable=True, unique=True)
\ No newline at end of file
+    email: Mapped[str] = mapped_column(nullable=True, unique=True)
+    tags: Mapped[List["Tag"]] = relationship(back_populates="sample")
+
+
+class Tag(ModelBase):
+    name: Mapped[str]
+    sample_id: Mapped[UUID] = mapped_column(ForeignKey("sample.id"))
+    sample: Mapped[Sample] = relationship(back_populates="tags")
+
+
+class Contact(ModelBase):
+    email: Mapped[str] = mapped_column(nullable=True)
+    touched: Mapped[datetime] = mapped_column(
+        nullable=True, onupdate=func.now()
+    )
+
+    @validates("email")
+    def validate_email(self, key: str, value: str) -> str:
+        return value.lower() if value else value
+
+
+class Invoice(ModelBase):
+    lines: Mapped[List["InvoiceLine"]] = relationship(
+        back_populates="invoice", cascade="all, delete-orphan"
+    )
+
+
+class InvoiceLine(ModelBase):
+    name: Mapped[str]
+    invoice_id: Mapped[UUID] = mapped_column(ForeignKey("invoice.id"))
+    invoice: Mapped[Invoice] = relationship(back_populates="lines")
+
+
+author_book = Table(
+    "author_book",
+    ModelBase.metadata,
+    Column("author_id", ForeignKey("author.id"), primary_key=True),
+    Column("book_id", ForeignKey("book.id"), primary_key=True),
+)
+
+
+class Author(ModelBase):
+    books: Mapped[List["Book"]] = relationship(
+        secondary=author_book, back_populates="authors"
+    )
+
+
+class Book(ModelBase):
+    authors: Mapped[List[Author]] = relationship(
+        secondary=author_book, back_populates="books"
+    )
+
+
+class Document(ModelBase):
+    title: Mapped[str] = mapped_column(nullable=True)
+    version: Mapped[int] = mapped_column(nullable=False)
+
+    __mapper_args__ = {"version_id_col": version}
@@ -26,3 +26,37 @@ class SampleInDB(SampleBase):
 
 class Sample(SampleInDB):
     ...
+
+
+class ContactCreate(BaseModel):
+    id: Optional[UUID] = None
+    email: Optional[str] = None
+
+
+class ContactUpdate(ContactCreate):
+    ...
+
+
+class InvoiceCreate(BaseModel):
+    id: Optional[UUID] = None
+
+
+class InvoiceUpdate(InvoiceCreate):
+    ...
+
+
+class AuthorCreate(BaseModel):
+    id: Optional[UUID] = None
+
+
+class AuthorUpdate(AuthorCreate):
+    ...
+
+
+class DocumentCreate(BaseModel):
+    id: Optional[UUID] = None
+    title: Optional[str] = None
+
+
+class DocumentUpdate(DocumentCreate):
+    ...
@@ -1,14 +1,36 @@
+import asyncio
+from datetime import datetime
 import os
+import tempfile
 from pathlib import Path
 import unittest
-from uuid import uuid1
+from uuid import UUID, uuid1
+from sqlalchemy import event, func, insert, select
+from sqlalchemy.exc import MultipleResultsFound
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.sql import text
 from ..models import ModelBase
+from ..session import make_engine, make_sessionmaker
 from ..exceptions.crud import NotFoundException, CreateException
-from .schemas import SampleCreate, SampleUpdate
-from .models import Sample
-from .session import AsyncSessionLocal, engine
-from .crud import samples
+from .schemas import (
+    AuthorCreate,
+    ContactCreate,
+    ContactUpdate,
+    DocumentCreate,
+    InvoiceCreate,
+    SampleCreate,
+    SampleUpdate,
+)
+from .models import Book, InvoiceLine, Sample, Tag, author_book
+from .session import AsyncSessionLocal, async_engine, engine
+from .crud import (
+    authors,
+    contacts,
+    documents,
+    invoices,
+    samples,
+    CRUDSample,
+)
 from .config import DB_NAME
 
 
@@ -42,6 +64,18 @@ class TestCRUD(unittest.IsolatedAsyncioTestCase):
                 error = SampleCreate(email=email)
                 await samples.create(db=db, element=error)
 
+    async def test_create_native_types(self) -> None:
+        async with AsyncSessionLocal() as db:
+            id = uuid1()
+            sample_create = SampleCreate(id=id, describe="native-types")
+            sample_obj = await samples.create(db=db, element=sample_create)
+            self.assertEqual(sample_obj.id, id)
+
+            sample_obj, = await samples.bulk_create(
+                db=db, elements=(SampleCreate(id=uuid1()),)
+            )
+            self.assertIsInstance(sample_obj.id, UUID)
+
     async def test_bulk_create(self) -> None:
         async with AsyncSessionLocal() as db:
             email = "fake-bulk-create@fakedomain.com"
@@ -64,6 +98,102 @@ class TestCRUD(unittest.IsolatedAsyncioTestCase):
                 error = SampleCreate(email=email)
                 await samples.bulk_create(db=db, elements=(s, error))
 
+    async def test_create_no_commit(self) -> None:
+        async with AsyncSessionLocal() as db:
+            async with db.begin():
+                a = await samples.create(
+                    db=db, element=SampleCreate(describe="atomic"), commit=False
+                )
+                b, = await samples.bulk_create(
+                    db=db,
+                    elements=(SampleCreate(describe="atomic"),),
+                    commit=False,
+                )
+                await samples.update(
+                    db=db, obj=b, data={"token": "atomic-token"}, commit=False
+                )
+            ids = {a.id, b.id}
+
+        async with AsyncSessionLocal() as db:
+            found = await samples.find(db=db, describe="atomic")
+            self.assertEqual({obj.id for obj in found}, ids)
+
+        # everything is rolled back on failure
+        async with AsyncSessionLocal() as db:
+            email = "fake-atomic@fakedomain.com"
+            with self.assertRaises(CreateException):
+                async with db.begin():
+                    await samples.delete(db=db, id=a.id, commit=False)
+                    await samples.create(
+                        db=db, element=SampleCreate(email=email), commit=False
+                    )
+                    await samples.create(
+                        db=db, element=SampleCreate(email=email), commit=False
+                    )
+
+        async with AsyncSessionLocal() as db:
+            found = await samples.find(db=db, describe="atomic")
+            self.assertEqual({obj.id for obj in found}, ids)
+            self.assertIsNone(await samples.find_one(db=db, email=email))
+
+            # clean up
+            for obj in found:
+                await samples.delete(db=db, id=obj.id)
+
+    async def test_bulk_create_chunks(self) -> None:
+        class CRUDSampleChunks(CRUDSample):
+            dump_chunk_size = 2
+
+        async with AsyncSessionLocal() as db:
+            elements = [
+                SampleCreate(token=f"chunk-{i}", describe="chunk")
+                for i in range(5)
+            ]
+            created = await CRUDSampleChunks().bulk_create(
+                db=db, elements=elements
+            )
+            self.assertEqual(
+                [obj.token for obj in created],
+                [element.token for element in elements],
+            )
+
+            # clean up
+            for obj in created:
+                await samples.delete(db=db, id=obj.id)
+
+    async def test_bulk_create_validators(self) -> None:
+        async with AsyncSessionLocal() as db:
+            created = await contacts.create(
+                db=db, element=ContactCreate(email="A@X.COM")
+            )
+            bulk_created, = await contacts.bulk_create(
+                db=db, elements=(ContactCreate(email="B@X.COM"),)
+            )
+            self.assertEqual(created.email, "a@x.com")
+            self.assertEqual(bulk_created.email, "b@x.com")
+
+    async def test_bulk_create_events(self) -> None:
+        inserted = []
+
+        def before_insert(mapper, connection, target) -> None:
+            inserted.append(target.token)
+
+        event.listen(Sample, "before_insert", before_insert)
+        try:
+            async with AsyncSessionLocal() as db:
+                created, = await samples.bulk_create(
+                    db=db, elements=(SampleCreate(token="test-events"),)
+                )
+                self.assertEqual(inserted, ["test-events"])
+                await samples.delete(db=db, id=created.id)
+        finally:
+            event.remove(Sample, "before_insert", before_insert)
+
+    async def test_bulk_create_empty(self) -> None:
+        async with AsyncSessionLocal() as db:
+            created = await samples.bulk_create(db=db, elements=())
+            self.assertEqual(list(created), [])
+
     async def test_list(self) -> None:
         async with AsyncSessionLocal() as db:
             all_ = await samples.list(db=db)
@@ -77,6 +207,24 @@ class TestCRUD(unittest.IsolatedAsyncioTestCase):
             skipped = await samples.list(db=db, offset=1)
             self.assertLess(len(skipped), len(all_))
 
+    async def test_list_after(self) -> None:
+        async with AsyncSessionLocal() as db:
+            all_ = await samples.list(db=db, limit=1000)
+
+            pages, after = [], None
+            while True:
+                page = await samples.list_after(db=db, after=after, limit=2)
+                if not page:
+                    break
+                self.assertLessEqual(len(page), 2)
+                pages.extend(page)
+                after = page[-1].id
+
+            self.assertEqual(len(pages), len(all_))
+            self.assertEqual({obj.id for obj in pages}, {o.id for o in all_})
+            ids = [obj.id for obj in pages]
+            self.assertEqual(ids, sorted(ids))
+
     async def test_filter(self) -> None:
         async with AsyncSessionLocal() as db:
             single = await samples.filter(
@@ -96,6 +244,109 @@ class TestCRUD(unittest.IsolatedAsyncioTestCase):
             )
             self.assertEqual(len(skipped_limited), 1)
 
+    async def test_filter_cache(self) -> None:
+        class CRUDSampleCached(CRUDSample):
+            filter_cache_size = 1
+
+        cached = CRUDSampleCached()
+        statements = []
+
+        def before_execute(conn, cursor, statement, *args) -> None:
+            statements.append(statement)
+
+        event.listen(
+            async_engine.sync_engine, "before_cursor_execute", before_execute
+        )
+        try:
+            async with AsyncSessionLocal() as db:
+                wc = text("describe = 'test-filter-cache'")
+                await samples.create(
+                    db=db, element=SampleCreate(describe="test-filter-cache")
+                )
+
+                first = await cached.filter(db=db, whereclause=wc)
+                self.assertEqual(len(first), 1)
+                self.assertIn("test-filter-cache", statements[-1])
+
+                # hit fetches by primary key
+                second = await cached.filter(db=db, whereclause=wc)
+                self.assertEqual(second, first)
+                self.assertNotIn("test-filter-cache", statements[-1])
+
+                # writes expire cached results
+                await samples.update(
+                    db=db, obj=first[0], data={"describe": "test-filter-done"}
+                )
+                third = await cached.filter(db=db, whereclause=wc)
+                self.assertEqual(third, [])
+
+                # least recently used results are dropped
+                await cached.filter(db=db, whereclause=wc, limit=1)
+                self.assertEqual(len(cached._filter_cache), 1)
+        finally:
+            event.remove(
+                async_engine.sync_engine,
+                "before_cursor_execute",
+                before_execute,
+            )
+
+    async def test_filter_cache_commit(self) -> None:
+        class CRUDSampleCached(CRUDSample):
+            filter_cache_size = 8
+
+        cached = CRUDSampleCached()
+        wc = Sample.describe == "test-filter-commit"
+
+        async with AsyncSessionLocal() as db:
+            await samples.create(
+                db=db,
+                element=SampleCreate(describe="test-filter-commit"),
+                commit=False,
+            )
+
+            # other sessions cache results before the commit
+            async with AsyncSessionLocal() as other:
+                objs = await cached.filter(db=other, whereclause=wc)
+                self.assertEqual(objs, [])
+
+            await db.commit()
+
+        # commit expires them
+        async with AsyncSessionLocal() as db:
+            objs = await cached.filter(db=db, whereclause=wc)
+            self.assertEqual(len(objs), 1)
+
+    async def test_filter_cache_engines(self) -> None:
+        class CRUDSampleCached(CRUDSample):
+            filter_cache_size = 8
+
+        cached = CRUDSampleCached()
+        wc = Sample.describe == "test-filter-engines"
+
+        async with AsyncSessionLocal() as db:
+            await samples.create(
+                db=db, element=SampleCreate(describe="test-filter-engines")
+            )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            other_engine = make_engine(
+                f"sqlite+aiosqlite:///{Path(tmp) / 'other.sqlite3'}"
+            )
+            try:
+                async with other_engine.begin() as conn:
+                    await conn.run_sync(ModelBase.metadata.create_all)
+
+                # results of other databases are cached apart
+                async with make_sessionmaker(other_engine)() as other:
+                    objs = await cached.filter(db=other, whereclause=wc)
+                    self.assertEqual(objs, [])
+
+                async with AsyncSessionLocal() as db:
+                    objs = await cached.filter(db=db, whereclause=wc)
+                    self.assertEqual(len(objs), 1)
+            finally:
+                await other_engine.dispose()
+
     async def test_find(self) -> None:
         async with AsyncSessionLocal() as db:
             single = await samples.find(db=db, token="fake-token-1")
@@ -119,6 +370,48 @@ class TestCRUD(unittest.IsolatedAsyncioTestCase):
             skip_all = await samples.find(db=db, describe="text", offset=5)
             self.assertEqual(len(skip_all), 0)
 
+    async def test_iter(self) -> None:
+        async with AsyncSessionLocal() as db:
+            all_ = await samples.list(db=db, limit=1000)
+            streamed = [obj async for obj in samples.iter(db=db)]
+            self.assertEqual(len(streamed), len(all_))
+            for obj in streamed:
+                self.assertIsInstance(obj, Sample)
+
+            # offset and limit when given
+            page = await samples.list(db=db, offset=1, limit=2)
+            streamed = [
+                obj async for obj in samples.iter(db=db, offset=1, limit=2)
+            ]
+            self.assertEqual(streamed, page)
+
+            wc = text("token LIKE '%fake%'")
+            filtered = await samples.filter(db=db, whereclause=wc, limit=2)
+            streamed = [
+                obj async for obj in samples.iter(db=db, whereclause=wc, limit=2)
+            ]
+            self.assertEqual(streamed, filtered)
+
+            found = [obj async for obj in samples.iter(db=db, describe="text")]
+            self.assertEqual(found, await samples.find(db=db, describe="text"))
+
+            # stop early
+            async for obj in samples.iter(db=db):
+                break
+            self.assertIsInstance(obj, Sample)
+
+            # not limited by default
+            created = await samples.bulk_create(
+                db=db, elements=[SampleCreate(describe="iter")] * 101
+            )
+            streamed = [o async for o in samples.iter(db=db, describe="iter")]
+            self.assertEqual(len(streamed), 101)
+
+            # clean up
+            for obj in created:
+                await samples.delete(db=db, id=obj.id, commit=False)
+            await db.commit()
+
     async def test_find_one(self) -> None:
         async with AsyncSessionLocal() as db:
             # unique with some data
@@ -137,6 +430,41 @@ class TestCRUD(unittest.IsolatedAsyncioTestCase):
             not_found = await samples.find_one(db=db, describe="not-found")
             self.assertIsNone(not_found)
 
+    async def test_count(self) -> None:
+        async with AsyncSessionLocal() as db:
+            all_ = await samples.list(db=db, limit=1000)
+            self.assertEqual(await samples.count(db=db), len(all_))
+
+            wc = samples.model.token == "fake-token-2"
+            self.assertEqual(await samples.count(db=db, whereclause=wc), 1)
+
+            wc = samples.model.describe == "not-found"
+            self.assertEqual(await samples.count(db=db, whereclause=wc), 0)
+
+    async def test_exists(self) -> None:
+        async with AsyncSessionLocal() as db:
+            self.assertTrue(await samples.exists(db=db))
+
+            wc = samples.model.token == "fake-token-2"
+            self.assertTrue(await samples.exists(db=db, whereclause=wc))
+
+            wc = samples.model.describe == "not-found"
+            self.assertFalse(await samples.exists(db=db, whereclause=wc))
+
+    async def test_find_exactly_one(self) -> None:
+        async with AsyncSessionLocal() as db:
+            single = await samples.find_exactly_one(db=db, token="fake-token-1")
+            self.assertIsInstance(single, Sample)
+            self.assertEqual(single.token, "fake-token-1")
+
+            # multiple results
+            with self.assertRaises(MultipleResultsFound):
+                await samples.find_exactly_one(db=db)
+
+            # not found data
+            with self.assertRaises(NotFoundException):
+                await samples.find_exactly_one(db=db, describe="not-found")
+
     async def test_get(self) -> None:
         async with AsyncSessionLocal() as db:
             # get all samples
@@ -150,6 +478,139 @@ class TestCRUD(unittest.IsolatedAsyncioTestCase):
             empty = await samples.get(db=db, id=uuid1())
             self.assertIsNone(empty)
 
+    async def test_get_cache(self) -> None:
+        async with AsyncSessionLocal() as db:
+            cache = {}
+            obj = await samples.find_one(db=db, cache=cache)
+
+            sample = await samples.get(db=db, id=obj.id, cache=cache)
+            self.assertIs(sample, obj)
+            self.assertIn((Sample, obj.id), cache)
+
+            found = await samples.find_one(db=db, token=obj.token, cache=cache)
+            self.assertIs(found, obj)
+            self.assertIn((Sample, (("token", obj.token),)), cache)
+
+            # cached results are returned without hitting the database
+            cache[(Sample, obj.id)] = "cached"
+            cached = await samples.get(db=db, id=obj.id, cache=cache)
+            self.assertEqual(cached, "cached")
+
+            # lookups with options bypass the cache
+            options = [selectinload(Sample.tags)]
+            loaded = await samples.get(
+                db=db, id=obj.id, cache=cache, options=options
+            )
+            self.assertIs(loaded, obj)
+            self.assertIn("tags", loaded.__dict__)
+            loaded = await samples.find_one(
+                db=db, token=obj.token, cache=cache, options=options
+            )
+            self.assertIs(loaded, obj)
+            cache[(Sample, obj.id)] = "cached"
+
+            # missing items are not cached
+            empty = await samples.get(db=db, id=uuid1(), cache=cache)
+            self.assertIsNone(empty)
+            self.assertEqual(len(cache), 3)
+
+            # writes invalidate model results
+            cache["other"] = "value"
+            cache[()] = "value"
+            await samples.update(
+                db=db, obj=obj, data={"describe": "test-cache"}, cache=cache
+            )
+            self.assertEqual(cache, {"other": "value", (): "value"})
+
+    async def test_get_loader(self) -> None:
+        async with AsyncSessionLocal() as db:
+            all_samples = await samples.list(db=db, limit=3)
+            ids = [obj.id for obj in all_samples] + [uuid1()]
+
+            loader = samples.loader(db=db)
+            loaded = await asyncio.gather(
+                *(samples.get(db=db, id=id, loader=loader) for id in ids)
+            )
+            self.assertEqual(loaded[:-1], all_samples)
+            self.assertIsNone(loaded[-1])
+
+            # loader is reusable after dispatch
+            sample = await loader.load(ids[0])
+            self.assertEqual(sample, all_samples[0])
+
+            # options belong to the loader
+            with self.assertRaises(ValueError):
+                await samples.get(
+                    db=db,
+                    id=ids[0],
+                    loader=loader,
+                    options=[selectinload(Sample.tags)],
+                )
+
+    async def test_options(self) -> None:
+        async with AsyncSessionLocal() as db:
+            sample = SampleCreate(describe="test-options")
+            obj = await samples.create(db=db, element=sample)
+            db.add_all([Tag(name=n, sample_id=obj.id) for n in ("a", "b")])
+            await db.commit()
+            id = obj.id
+
+        options = [selectinload(Sample.tags)]
+        async with AsyncSessionLocal() as db:
+            obj = await samples.get(db=db, id=id, options=options)
+            self.assertEqual(sorted(t.name for t in obj.tags), ["a", "b"])
+
+        async with AsyncSessionLocal() as db:
+            objs = await samples.find(
+                db=db, describe="test-options", options=options
+            )
+            self.assertEqual(len(objs[0].tags), 2)
+
+        async with AsyncSessionLocal() as db:
+            objs = await samples.filter(
+                db=db, whereclause=Sample.id == id, options=options
+            )
+            self.assertEqual(len(objs[0].tags), 2)
+
+        async with AsyncSessionLocal() as db:
+            objs = await samples.list(db=db, limit=1000, options=options)
+            obj = next(o for o in objs if o.id == id)
+            self.assertEqual(len(obj.tags), 2)
+
+        # defaults from subclass
+        class CRUDSampleTags(CRUDSample):
+            default_options = (selectinload(Sample.tags),)
+
+        async with AsyncSessionLocal() as db:
+            obj = await CRUDSampleTags().find_one(db=db, id=id)
+            self.assertEqual(len(obj.tags), 2)
+
+        # wildcard joined loaders are uniqued too
+        async with AsyncSessionLocal() as db:
+            objs = await samples.find(
+                db=db, describe="test-options", options=[joinedload("*")]
+            )
+            self.assertEqual(len(objs), 1)
+
+        # joined collections are uniqued
+        options = [joinedload(Sample.tags)]
+        async with AsyncSessionLocal() as db:
+            objs = await samples.find(
+                db=db, describe="test-options", options=options
+            )
+            self.assertEqual(len(objs), 1)
+            self.assertEqual(len(objs[0].tags), 2)
+
+            obj = await samples.find_exactly_one(
+                db=db, describe="test-options", options=options
+            )
+            self.assertIs(obj, objs[0])
+
+            streamed = [
+                o async for o in samples.iter(db=db, id=id, options=options)
+            ]
+            self.assertEqual(streamed, objs)
+
     async def test_get_or_raise(self) -> None:
         async with AsyncSessionLocal() as db:
             # get all samples
@@ -182,6 +643,23 @@ class TestCRUD(unittest.IsolatedAsyncioTestCase):
             self.assertEqual(id, obj.id)
             self.assertEqual(id_, obj.id)
 
+    async def test_save_no_commit(self) -> None:
+        async with AsyncSessionLocal() as db:
+            obj = await samples.find_one(db=db)
+            id, describe = obj.id, obj.describe
+
+            # flush only, caller owns the transaction
+            obj.describe = "test-save-no-commit"
+            obj = await samples._save(db=db, element=obj, commit=False)
+            self.assertTrue(db.in_transaction())
+            self.assertEqual(obj.describe, "test-save-no-commit")
+
+            await db.rollback()
+
+        async with AsyncSessionLocal() as db:
+            obj = await samples.get(db=db, id=id)
+            self.assertEqual(obj.describe, describe)
+
     async def test_save_all(self) -> None:
         async with AsyncSessionLocal() as db:
             # get element
@@ -216,17 +694,104 @@ class TestCRUD(unittest.IsolatedAsyncioTestCase):
             updated_ = obj.updated_at
             id = obj.id
 
-            data = SampleUpdate(describe="test-update")
+            data = SampleUpdate(describe="test-update-1")
             obj = await samples.update(db=db, obj=obj, data=data)
 
-            self.assertEqual(obj.describe, "test-update")
+            self.assertEqual(obj.describe, "test-update-1")
             self.assertEqual(obj.id, id)
             self.assertNotEqual(obj.updated_at, updated_)
 
+            updated_ = obj.updated_at
             obj = await samples.update(
                 db=db, obj=obj, data={"describe": "test-update-2"}
             )
             self.assertEqual(obj.describe, "test-update-2")
+            self.assertNotEqual(obj.updated_at, updated_)
+
+            # pending changes on instance are kept
+            obj.email = "fake-update@fakedomain.com"
+            obj = await samples.update(
+                db=db, obj=obj, data={"describe": "test-update-3"}
+            )
+            self.assertEqual(obj.describe, "test-update-3")
+            self.assertEqual(obj.email, "fake-update@fakedomain.com")
+
+        async with AsyncSessionLocal() as db:
+            obj = await samples.get(db=db, id=id)
+            self.assertEqual(obj.describe, "test-update-3")
+            self.assertEqual(obj.email, "fake-update@fakedomain.com")
+
+    async def test_update_validators(self) -> None:
+        async with AsyncSessionLocal() as db:
+            obj = await contacts.create(
+                db=db, element=ContactCreate(email="a@x.com")
+            )
+            obj = await contacts.update(
+                db=db, obj=obj, data={"email": "C@X.COM"}
+            )
+            self.assertEqual(obj.email, "c@x.com")
+
+        async with AsyncSessionLocal() as db:
+            obj = await contacts.get(db=db, id=obj.id)
+            self.assertEqual(obj.email, "c@x.com")
+
+    async def test_update_onupdate_expression(self) -> None:
+        async with AsyncSessionLocal() as db:
+            obj = await contacts.create(
+                db=db, element=ContactCreate(email="touch@x.com")
+            )
+            self.assertIsNone(obj.touched)
+
+            # values computed by the database are loaded on update
+            obj = await contacts.update(
+                db=db, obj=obj, data=ContactUpdate(email="touched@x.com")
+            )
+            self.assertIsInstance(obj.touched, datetime)
+
+    async def test_update_detached(self) -> None:
+        async with AsyncSessionLocal() as db:
+            obj = await samples.create(
+                db=db, element=SampleCreate(describe="test-detached")
+            )
+
+        # instances from other sessions are attached and updated
+        async with AsyncSessionLocal() as db:
+            updated = await samples.update(
+                db=db, obj=obj, data={"describe": "test-detached-done"}
+            )
+            self.assertIs(updated, obj)
+            self.assertEqual(obj.describe, "test-detached-done")
+
+    async def test_update_version_counter(self) -> None:
+        async with AsyncSessionLocal() as db:
+            obj = await documents.create(db=db, element=DocumentCreate())
+            self.assertEqual(obj.version, 1)
+
+            # dict updates keep optimistic locking of the ORM
+            obj = await documents.update(
+                db=db, obj=obj, data={"title": "versioned"}
+            )
+            self.assertEqual(obj.version, 2)
+
+    async def test_update_events(self) -> None:
+        updated = []
+
+        def before_update(mapper, connection, target) -> None:
+            updated.append(target.describe)
+
+        event.listen(Sample, "before_update", before_update)
+        try:
+            async with AsyncSessionLocal() as db:
+                obj = await samples.create(
+                    db=db, element=SampleCreate(describe="test-events")
+                )
+                await samples.update(
+                    db=db, obj=obj, data={"describe": "test-events-2"}
+                )
+                self.assertEqual(updated, ["test-events-2"])
+                await samples.delete(db=db, id=obj.id)
+        finally:
+            event.remove(Sample, "before_update", before_update)
 
     async def test_delete(self) -> None:
         async with AsyncSessionLocal() as db:
@@ -235,8 +800,55 @@ class TestCRUD(unittest.IsolatedAsyncioTestCase):
 
             deleted = await samples.delete(db=db, id=obj.id)
             self.assertEqual(obj, deleted)
+            self.assertNotIn(deleted, db)
 
             not_found = await samples.find_one(
                 db=db, describe="for-test-delete"
             )
             self.assertIsNone(not_found)
+
+            # not found with raise
+            with self.assertRaises(NotFoundException):
+                await samples.delete(db=db, id=obj.id)
+
+            # models without relationships to handle use DELETE RETURNING
+            contact = await contacts.create(
+                db=db, element=ContactCreate(email="delete@fake.com")
+            )
+            deleted = await contacts.delete(db=db, id=contact.id)
+            self.assertEqual(deleted.id, contact.id)
+            self.assertIsNone(await contacts.get(db=db, id=contact.id))
+
+    async def test_delete_cascade(self) -> None:
+        async with AsyncSessionLocal() as db:
+            obj = await invoices.create(db=db, element=InvoiceCreate())
+            db.add_all([InvoiceLine(name=n, invoice_id=obj.id) for n in "ab"])
+            await db.commit()
+
+            deleted = await invoices.delete(db=db, id=obj.id)
+            self.assertEqual(deleted.id, obj.id)
+
+            # children removed by the relationship cascade
+            result = await db.execute(
+                select(func.count()).select_from(InvoiceLine)
+            )
+            self.assertEqual(result.scalar_one(), 0)
+
+    async def test_delete_secondary(self) -> None:
+        async with AsyncSessionLocal() as db:
+            obj = await authors.create(db=db, element=AuthorCreate())
+            book = Book()
+            db.add(book)
+            await db.flush()
+            await db.execute(
+                insert(author_book).values(author_id=obj.id, book_id=book.id)
+            )
+            await db.commit()
+
+            await authors.delete(db=db, id=obj.id)
+
+            # association rows removed with the item
+            result = await db.execute(
+                select(func.count()).select_from(author_book)
+            )
+            self.assertEqual(result.scalar_one(), 0)
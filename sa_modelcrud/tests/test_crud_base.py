@@ -1,7 +1,20 @@
 import unittest
+from typing import List
+from uuid import UUID
 
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import (
+    Mapped,
+    defer,
+    joinedload,
+    mapped_column,
+    relationship,
+    selectinload,
+)
 from ..crud.base import CRUDBase
-from .models import Sample
+from ..crud.utils import unique_required
+from ..models import ModelBase
+from .models import Sample, Tag
 from .schemas import SampleCreate, SampleUpdate
 from .crud import samples
 
@@ -23,3 +36,56 @@ class TestCRUD(unittest.TestCase):
         # create an instance from property
         sm = samples.model(email="sample@sample")
         self.assertIsInstance(sm, Sample)
+
+    def test_subclass_init(self) -> None:
+        class CRUDSampleInit(CRUDBase[Sample, SampleCreate, SampleUpdate]):
+            model = Sample
+
+            def __init__(self, name: str) -> None:
+                self.name = name
+
+        # no super().__init__() call required
+        crud = CRUDSampleInit("samples")
+        self.assertIsNotNone(crud._get_stmt)
+        self.assertIsNotNone(crud._list_stmt)
+        self.assertEqual(len(crud._filter_cache), 0)
+
+    def test_model_defined_later(self) -> None:
+        class Early(ModelBase):
+            lates: Mapped[List["Late"]] = relationship()
+
+        class CRUDEarly(CRUDBase[Early, SampleCreate, SampleUpdate]):
+            model = Early
+
+        # related model does not exist yet
+        early = CRUDEarly()
+
+        class Late(ModelBase):
+            early_id: Mapped[UUID] = mapped_column(ForeignKey("early.id"))
+
+        self.assertIn("id", early._column_keys)
+        self.assertEqual(early._server_attrs, [])
+        self.assertFalse(early._unique_default)
+
+    def test_unique_required(self) -> None:
+        self.assertFalse(unique_required(Sample))
+        self.assertFalse(unique_required(Sample, [selectinload(Sample.tags)]))
+        self.assertFalse(unique_required(Sample, [defer(Sample.email)]))
+        self.assertFalse(unique_required(Tag, [joinedload(Tag.sample)]))
+        self.assertFalse(unique_required(Tag, [joinedload("*")]))
+        self.assertFalse(unique_required(Sample, [selectinload("*")]))
+        self.assertFalse(unique_required(Sample, [defer("*")]))
+
+        # joined collections
+        self.assertTrue(unique_required(Sample, [joinedload(Sample.tags)]))
+        self.assertTrue(
+            unique_required(
+                Tag, [joinedload(Tag.sample).joinedload(Sample.tags)]
+            )
+        )
+
+        # wildcards on entities with collections
+        self.assertTrue(unique_required(Sample, [joinedload("*")]))
+        self.assertTrue(
+            unique_required(Tag, [joinedload(Tag.sample).joinedload("*")])
+        )
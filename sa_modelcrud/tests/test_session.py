@@ -0,0 +1,71 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.pool import NullPool
+from ..session import make_engine, make_sessionmaker, warmup
+from .config import DB_URI_ASYNC
+
+
+class TestSession(unittest.TestCase):
+    def test_make_engine(self) -> None:
+        engine = make_engine(DB_URI_ASYNC)
+        self.assertEqual(engine.sync_engine._compiled_cache.capacity, 1200)
+        self.assertTrue(engine.pool._pre_ping)
+
+        # pool sizing
+        self.assertEqual(engine.pool.size(), 10)
+        self.assertEqual(engine.pool._max_overflow, 20)
+        self.assertEqual(engine.pool._recycle, 1800)
+
+        # overridden defaults
+        engine = make_engine(
+            DB_URI_ASYNC, query_cache_size=10, pool_size=2, max_overflow=0
+        )
+        self.assertEqual(engine.sync_engine._compiled_cache.capacity, 10)
+        self.assertEqual(engine.pool.size(), 2)
+        self.assertEqual(engine.pool._max_overflow, 0)
+
+        # pools without sizing
+        make_engine("sqlite+aiosqlite://")
+        make_engine(DB_URI_ASYNC, poolclass=NullPool)
+
+    def test_make_sessionmaker(self) -> None:
+        engine = make_engine(DB_URI_ASYNC)
+        session_local = make_sessionmaker(engine)
+        self.assertFalse(session_local.kw["expire_on_commit"])
+        self.assertIs(session_local.kw["bind"], engine)
+
+        # read only sessions
+        session_local = make_sessionmaker(engine, autocommit=True)
+        bind = session_local.kw["bind"]
+        self.assertEqual(
+            bind.get_execution_options()["isolation_level"], "AUTOCOMMIT"
+        )
+
+
+class TestWarmup(unittest.IsolatedAsyncioTestCase):
+    async def test_warmup(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(tmp) / "warmup.sqlite3"
+            engine = make_engine(f"sqlite+aiosqlite:///{db_path}", pool_size=3)
+
+            await warmup(engine)
+            self.assertEqual(engine.pool.checkedin(), 3)
+            self.assertEqual(engine.pool.checkedout(), 0)
+
+            await warmup(engine, connections=1)
+            self.assertEqual(engine.pool.checkedin(), 3)
+
+            # read only sessions run without transaction
+            session_local = make_sessionmaker(engine, autocommit=True)
+            async with session_local() as db:
+                conn = await db.connection()
+                options = conn.sync_connection.get_execution_options()
+                self.assertEqual(options["isolation_level"], "AUTOCOMMIT")
+
+                result = await db.execute(text("SELECT 1"))
+                self.assertEqual(result.scalar(), 1)
+
+            await engine.dispose()